@@ -0,0 +1,236 @@
+from fastapi import FastAPI, File, HTTPException, Request, UploadFile
+from fastapi.responses import Response
+import asyncio
+import functools
+import pyodbc
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+app = FastAPI()
+
+MAX_FILE_SIZE_KB = 10
+
+# Slack on top of the file cap for the multipart boundary and part headers.
+_MAX_BODY_BYTES = MAX_FILE_SIZE_KB * 1024 + 4096
+
+
+class MaxBodySizeMiddleware:
+    """Abort uploads as soon as the streamed body exceeds the size cap.
+
+    UploadFile only exists after Starlette has buffered the whole body,
+    so an oversized upload would otherwise pay full I/O before the size
+    check rejects it. Counting bytes on the receive channel bounds the
+    work done for adversarial input to O(limit).
+    """
+
+    def __init__(self, app, max_bytes):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        total = 0
+
+        async def limited_receive():
+            nonlocal total
+            message = await receive()
+            if message["type"] == "http.request":
+                total += len(message.get("body", b""))
+                if total > self.max_bytes:
+                    raise HTTPException(
+                        status_code=413, detail="Uploaded file is too large"
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+app.add_middleware(MaxBodySizeMiddleware, max_bytes=_MAX_BODY_BYTES)
+
+connection_string = (
+    "DRIVER={ODBC Driver 17 for SQL Server};"
+    "SERVER=localhost;"
+    "DATABASE=ValidationDB;"
+    "Trusted_Connection=yes;"
+)
+
+ALLOWED_HEADERS = ("CUSTOMER", "ADDRESS", "PRODUCT", "PRODUCT_TYPE", "PRICE")
+
+_NAME_RE = re.compile(r"[A-Za-z0-9 ]+")
+
+_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+_conn = None
+_conn_lock = threading.Lock()
+
+
+def get_db_connection():
+    """Return the shared pyodbc connection, creating it on first use.
+
+    Connecting to SQL Server pays a full TCP + auth handshake, so the
+    connection is opened once and reused across requests instead of being
+    re-established per insert.
+    """
+    global _conn
+    with _conn_lock:
+        if _conn is None:
+            _conn = pyodbc.connect(connection_string, autocommit=False)
+        return _conn
+
+
+def insert_validation_results(conn, results):
+    """Insert all validation results for one upload in a single batch."""
+    with conn:
+        cursor = conn.cursor()
+        cursor.fast_executemany = True
+        cursor.setinputsizes(
+            [
+                (pyodbc.SQL_WVARCHAR, 260, 0),  # file_name
+                (pyodbc.SQL_WVARCHAR, 64, 0),  # validation_rule
+                (pyodbc.SQL_WVARCHAR, 512, 0),  # result
+            ]
+        )
+        cursor.executemany(
+            "INSERT INTO ValidationResults (file_name, validation_rule, result) "
+            "VALUES (?, ?, ?)",
+            results,
+        )
+        cursor.close()
+
+
+@functools.lru_cache(maxsize=1024)
+def _name_ok(base_name):
+    return _NAME_RE.fullmatch(base_name) is not None
+
+
+def validate_file_name(file_name):
+    base_name = os.path.splitext(file_name)[0]
+    if _name_ok(base_name):
+        return "✅ File name is valid"
+    return "❌ File name is invalid"
+
+
+def validate_file_size(size_bytes):
+    if size_bytes <= MAX_FILE_SIZE_KB * 1024:
+        return f"✅ File size is within the {MAX_FILE_SIZE_KB} KB limit"
+    return f"❌ File size exceeds the {MAX_FILE_SIZE_KB} KB limit"
+
+
+def validate_file_type(file_name):
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension in (".csv", ".txt"):
+        return "✅ File type is supported"
+    return "❌ File type is not supported"
+
+
+def detect_delimiter(buf, extension):
+    if extension != ".txt":
+        return ","
+    first_line = buf.split(b"\n", 1)[0].decode(errors="replace").rstrip("\r")
+    for candidate in ["\t", ",", " "]:
+        if tuple(first_line.split(candidate)) == ALLOWED_HEADERS:
+            return candidate
+    return ","
+
+
+def validate_content(buf, extension):
+    """Run the header, null-value and empty-row checks in one pass.
+
+    The schema is fixed (ALLOWED_HEADERS, no quoting), so rows are split
+    directly on the detected delimiter instead of going through the
+    generic csv state machine; at the 10 KB cap the per-row dispatch
+    overhead is what dominates.
+    """
+    delimiter = detect_delimiter(buf, extension)
+    lines = buf.decode(errors="replace").splitlines()
+    headers = tuple(lines[0].split(delimiter)) if lines else ()
+
+    has_null = False
+    has_empty = False
+    for line in lines[1:]:
+        row_has_content = False
+        row_has_blank = False
+        for cell in line.split(delimiter):
+            if cell == "":
+                row_has_blank = True
+            elif cell.strip():
+                row_has_content = True
+        has_empty = has_empty or not row_has_content
+        has_null = has_null or row_has_blank
+        if has_null and has_empty:
+            break
+
+    return (
+        "✅ Headers are valid" if headers == ALLOWED_HEADERS else "❌ Headers are invalid",
+        "❌ File contains null values" if has_null else "✅ No null values found",
+        "❌ File contains empty rows" if has_empty else "✅ No empty rows found",
+    )
+
+
+@app.post("/process/")
+async def process_files(request: Request, report_file: UploadFile = File(...)):
+    file_name = report_file.filename
+    results = []
+
+    def finish():
+        insert_validation_results(get_db_connection(), results)
+        return {
+            "file_name": file_name,
+            "results": {rule: message for _, rule, message in results},
+        }
+
+    size_bytes = report_file.size
+    if size_bytes is None:
+        size_bytes = int(request.headers.get("content-length", 0))
+
+    metadata_checks = (
+        ("File Name Check", lambda: validate_file_name(file_name)),
+        ("File Size Check", lambda: validate_file_size(size_bytes)),
+        ("File Type Check", lambda: validate_file_type(file_name)),
+    )
+    for rule, check in metadata_checks:
+        message = check()
+        results.append((file_name, rule, message))
+        if "❌" in message:
+            return finish()
+
+    extension = os.path.splitext(file_name)[1].lower()
+    buf = await report_file.read(MAX_FILE_SIZE_KB * 1024)
+    content_results = await asyncio.get_running_loop().run_in_executor(
+        _executor, validate_content, buf, extension
+    )
+
+    content_rules = ("Header Check", "Null Value Check", "Empty Row Check")
+    for rule, message in zip(content_rules, content_results):
+        results.append((file_name, rule, message))
+        if "❌" in message:
+            break
+
+    return finish()
+
+
+_INDEX_HTML = None
+
+
+def _get_index():
+    """Read index.html once, lazily, and cache the raw bytes.
+
+    Keeping this out of module import means forked workers don't each
+    redo the read at boot, and the cached bytes are shared copy-on-write.
+    """
+    global _INDEX_HTML
+    if _INDEX_HTML is None:
+        _INDEX_HTML = Path(__file__).with_name("index.html").read_bytes()
+    return _INDEX_HTML
+
+
+@app.get("/")
+async def index():
+    return Response(content=_get_index(), media_type="text/html")